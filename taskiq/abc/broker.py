@@ -176,8 +176,9 @@ class AsyncBroker(ABC):
         for middleware in middlewares:
             if not isinstance(middleware, TaskiqMiddleware):
                 logger.warning(
-                    f"Middleware {middleware} is not an instance of TaskiqMiddleware. "
+                    "Middleware %s is not an instance of TaskiqMiddleware. "
                     "Skipping...",
+                    middleware,
                 )
                 continue
             middleware.set_broker(self)
@@ -457,8 +458,9 @@ class AsyncBroker(ABC):
         for middleware in middlewares:
             if not isinstance(middleware, TaskiqMiddleware):
                 logger.warning(
-                    f"Middleware {middleware} is not an instance of TaskiqMiddleware. "
+                    "Middleware %s is not an instance of TaskiqMiddleware. "
                     "Skipping...",
+                    middleware,
                 )
                 continue
             middleware.set_broker(self)
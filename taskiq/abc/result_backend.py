@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Iterable, Optional, Tuple, TypeVar
 
 from taskiq.result import TaskiqResult
 
@@ -32,6 +33,24 @@ class AsyncResultBackend(ABC, Generic[_ReturnType]):
         :return: nothing.
         """
 
+    async def set_results(
+        self,
+        results: Iterable[Tuple[str, TaskiqResult[_ReturnType]]],
+    ) -> None:
+        """
+        Saves several results at once.
+
+        By default results are saved concurrently with
+        separate set_result calls, but backends can
+        override this method to pipeline all writes
+        into a single network round-trip.
+
+        :param results: (task_id, result) pairs to save.
+        """
+        await asyncio.gather(
+            *(self.set_result(task_id, result) for task_id, result in results),
+        )
+
     @abstractmethod
     async def is_result_ready(self, task_id: str) -> bool:
         """
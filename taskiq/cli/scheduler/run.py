@@ -140,7 +140,7 @@ async def run_scheduler_loop(scheduler: TaskiqScheduler) -> None:
 
     :param scheduler: current scheduler.
     """
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     running_schedules = set()
     while True:
         # We use this method to correctly sleep for one minute.
@@ -212,7 +212,7 @@ async def run_scheduler(args: SchedulerArgs) -> None:
         )
         delay = next_minute - datetime.utcnow()
         delay_secs = int(delay.total_seconds())
-        logger.info(f"Skipping first run. Waiting {delay_secs} seconds.")
+        logger.info("Skipping first run. Waiting %s seconds.", delay_secs)
         await asyncio.sleep(delay.total_seconds())
         logger.info("First run skipped. The scheduler is now running.")
     try:
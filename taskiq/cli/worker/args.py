@@ -46,6 +46,8 @@ class WorkerArgs:
     max_tasks_per_child: Optional[int] = None
     wait_tasks_timeout: Optional[float] = None
     hardkill_count: int = 3
+    result_batch_size: int = 0
+    loop: str = "auto"
 
     @classmethod
     def from_cli(
@@ -145,7 +147,12 @@ class WorkerArgs:
         parser.add_argument(
             "--max-threadpool-threads",
             type=int,
-            help="Maximum number of threads for executing sync functions.",
+            help=(
+                "Maximum number of threads for executing sync functions. "
+                "If not set, python's default of "
+                "min(32, cpu_count + 4) threads is used. "
+                "Bump it for workloads with many blocking sync tasks."
+            ),
         )
         parser.add_argument(
             "--shutdown-timeout",
@@ -171,7 +178,9 @@ class WorkerArgs:
             type=int,
             dest="max_async_tasks",
             default=100,
-            help="Maximum simultaneous async tasks per worker process. ",
+            help="Maximum number of messages processed concurrently "
+            "by one worker process. Each message runs in its own "
+            "asyncio task, so I/O-bound tasks overlap up to this limit.",
         )
         parser.add_argument(
             "--max-prefetch",
@@ -213,6 +222,22 @@ class WorkerArgs:
             help="Maximum time to wait for all current tasks "
             "to finish before exiting.",
         )
+        parser.add_argument(
+            "--loop",
+            default="auto",
+            choices=["auto", "uvloop", "asyncio"],
+            help="Event loop implementation to use. "
+            "With 'auto' uvloop is picked when it's installed. "
+            "`uv` extra is required for the uvloop option.",
+        )
+        parser.add_argument(
+            "--result-batch-size",
+            type=int,
+            default=0,
+            help="How many results to save in the result backend "
+            "with a single batched call. "
+            "Disabled by default, results are saved one by one.",
+        )
         parser.add_argument(
             "--hardkill-count",
             type=int,
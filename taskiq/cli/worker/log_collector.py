@@ -32,6 +32,12 @@ def log_collector(
     from stdout, stderr and root logger
     to some new target.
 
+    The receiver doesn't install this collector for
+    every executed task anymore, since allocating a
+    stream and patching handlers per message is pure
+    overhead for tasks that never write logs. It's
+    kept as an opt-in utility.
+
     It can be used like this:
 
     >>> logs = io.StringIO()
@@ -82,11 +82,13 @@ def start_listen(args: WorkerArgs) -> None:
     :param event: Event for notification.
     :raises ValueError: if broker is not an AsyncBroker instance.
     :raises ValueError: if receiver is not a Receiver type.
+    :raises ValueError: if uvloop is requested, but not installed.
     """
     shutdown_event = asyncio.Event()
     hardkill_counter = 0
+    listen_task: "Optional[asyncio.Task[None]]" = None
 
-    def interrupt_handler(signum: int, _frame: Any) -> None:
+    def interrupt_handler(signum: int, _frame: Any = None) -> None:
         """
         Signal handler.
 
@@ -95,10 +97,10 @@ def start_listen(args: WorkerArgs) -> None:
 
         :param signum: received signal number.
         :param _frame: current execution frame.
-        :raises KeyboardInterrupt: if termination hasn't begun.
+        :raises KeyboardInterrupt: if termination hasn't begun
+            and the listening hasn't started yet.
         """
-        logger.debug(f"Got signal {signum}.")
-        nonlocal shutdown_event
+        logger.debug("Got signal %s.", signum)
         nonlocal hardkill_counter
         # Soft kill is a signal to start shutdown.
         shutdown_event.set()
@@ -106,15 +108,16 @@ def start_listen(args: WorkerArgs) -> None:
         # everything immediately.
         if hardkill_counter > args.hardkill_count:
             logger.warning("Hard kill. Exiting.")
-            raise KeyboardInterrupt
+            if listen_task is not None:
+                listen_task.cancel()
+            else:
+                raise KeyboardInterrupt
         hardkill_counter += 1
 
-    signal.signal(signal.SIGINT, interrupt_handler)
-    signal.signal(signal.SIGTERM, interrupt_handler)
-    if sys.platform != "win32":
-        signal.signal(signal.SIGHUP, interrupt_handler)
+    if args.loop == "uvloop" and uvloop is None:
+        raise ValueError("To use '--loop uvloop', please install 'taskiq[uv]'.")
 
-    if uvloop is not None:
+    if uvloop is not None and args.loop in ("auto", "uvloop"):
         logger.debug("UVLOOP found. Using it as async runner")
         loop = uvloop.new_event_loop()  # type: ignore
     else:
@@ -122,6 +125,17 @@ def start_listen(args: WorkerArgs) -> None:
 
     asyncio.set_event_loop(loop)
 
+    if sys.platform == "win32":
+        signal.signal(signal.SIGINT, interrupt_handler)
+        signal.signal(signal.SIGTERM, interrupt_handler)
+    else:
+        # Handlers installed via the loop are delivered in
+        # the loop's own context, instead of re-entering
+        # python from an arbitrary point of execution.
+        loop.add_signal_handler(signal.SIGINT, interrupt_handler, signal.SIGINT)
+        loop.add_signal_handler(signal.SIGTERM, interrupt_handler, signal.SIGTERM)
+        loop.add_signal_handler(signal.SIGHUP, interrupt_handler, signal.SIGHUP)
+
     # This option signals that current
     # broker is running as a worker.
     # We must set this field before importing tasks,
@@ -138,6 +152,10 @@ def start_listen(args: WorkerArgs) -> None:
     try:
         logger.debug("Initialize receiver.")
         with ThreadPoolExecutor(args.max_threadpool_threads) as pool:
+            # Share one pool with everything that uses the loop's
+            # default executor, so sync tasks and to_thread-style
+            # calls don't compete with a separate undersized pool.
+            loop.set_default_executor(pool)
             receiver = receiver_type(
                 broker=broker,
                 executor=pool,
@@ -148,10 +166,12 @@ def start_listen(args: WorkerArgs) -> None:
                 ack_type=args.ack_type,
                 max_tasks_to_execute=args.max_tasks_per_child,
                 wait_tasks_timeout=args.wait_tasks_timeout,
+                result_batch_size=args.result_batch_size,
                 **receiver_kwargs,  # type: ignore
             )
-            loop.run_until_complete(receiver.listen(shutdown_event))
-    except KeyboardInterrupt:
+            listen_task = loop.create_task(receiver.listen(shutdown_event))
+            loop.run_until_complete(listen_task)
+    except (KeyboardInterrupt, asyncio.CancelledError):
         logger.warning("Worker process interrupted.")
         loop.run_until_complete(shutdown_broker(broker, args.shutdown_timeout))
 
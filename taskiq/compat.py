@@ -1,6 +1,6 @@
 # flake8: noqa
-from functools import lru_cache
-from typing import Any, Dict, Optional, Type, TypeVar, Union
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Optional, Type, TypeVar, Union
 
 import pydantic
 from importlib_metadata import version
@@ -21,6 +21,16 @@ if IS_PYDANTIC2:
     def parse_obj_as(annot: T, obj: Any) -> T:
         return create_type_adapter(annot).validate_python(obj)
 
+    def build_validator(annot: Any) -> Callable[[Any], Any]:
+        # Some annotations cannot be turned into adapters
+        # ahead of time (e.g. arbitrary classes used for
+        # dependency injection). For them we defer the work
+        # to the call time, as parse_obj_as does.
+        try:
+            return create_type_adapter(annot).validate_python
+        except Exception:
+            return partial(parse_obj_as, annot)
+
     def model_validate(
         model_class: Type[Model],
         message: Dict[str, Any],
@@ -51,6 +61,9 @@ if IS_PYDANTIC2:
 else:
     parse_obj_as = pydantic.parse_obj_as  # type: ignore
 
+    def build_validator(annot: Any) -> Callable[[Any], Any]:
+        return partial(pydantic.parse_obj_as, annot)
+
     def model_validate(
         model_class: Type[Model],
         message: Dict[str, Any],
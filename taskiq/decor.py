@@ -1,3 +1,5 @@
+import inspect
+from contextlib import suppress
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
@@ -54,6 +56,13 @@ class AsyncTaskiqDecoratedTask(Generic[_FuncParams, _ReturnType]):
         self.task_name = task_name
         self.original_func = original_func
         self.labels = labels
+        # Signature is computed once at decoration time,
+        # so receivers can reuse it instead of rebuilding
+        # it for every registered task on startup.
+        with suppress(AttributeError, TypeError, ValueError):
+            original_func.__taskiq_signature__ = (  # type: ignore
+                inspect.signature(original_func)
+            )
 
     # Docs for this method are omitted in order to help
     # your IDE resolve correct docs for it.
@@ -29,7 +29,7 @@ async def gather(
     :raises TaskiqResultTimeoutError: if timeout is reached.
     :return: list of TaskiqResults.
     """
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     start_time = time()
     ordered_ids = [task.task_id for task in tasks]
     task_ids = {task.task_id for task in tasks}
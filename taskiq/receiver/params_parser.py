@@ -1,23 +1,57 @@
 import inspect
-from logging import getLogger
-from typing import Any, Dict, Optional
+from logging import DEBUG, getLogger
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from taskiq.compat import parse_obj_as
+from taskiq.compat import build_validator
 from taskiq.message import TaskiqMessage
 
 logger = getLogger(__name__)
 
+ParamSpecs = Tuple[Tuple[str, Callable[[Any], Any]], ...]
 
-def parse_params(
+
+def build_param_specs(
     signature: Optional[inspect.Signature],
     type_hints: Dict[str, Any],
+) -> Optional[ParamSpecs]:
+    """
+    Build compact parameter specs from a signature.
+
+    This function precomputes a tuple of
+    (name, validator) pairs for all annotated
+    parameters of a function. It's done once
+    per task, so `parse_params` doesn't have
+    to iterate over the signature, resolve
+    annotations and build pydantic validators
+    for every incoming message.
+
+    Why do we need type_hints separate with
+    Signature. The reason is simple.
+    If some variable doesn't have a type hint
+    it won't be added in the dict of type hints.
+
+    :param signature: original function's signature.
+    :param type_hints: function's type hints.
+    :return: tuple of (name, validator) pairs or None.
+    """
+    if signature is None:
+        return None
+    return tuple(
+        (param_name, build_validator(type_hints[param_name]))
+        for param_name in signature.parameters
+        if param_name in type_hints
+    )
+
+
+def parse_params(
+    param_specs: Optional[ParamSpecs],
     message: TaskiqMessage,
 ) -> None:
     """
     Parses incoming parameters.
 
-    This function uses signature to get
-    expected types of parameters.
+    This function uses precomputed param specs
+    to get expected types of parameters.
 
     If the parameter from TaskiqMessage
     has different type it will try to parse
@@ -42,48 +76,38 @@ def parse_params(
     or you can make some of parameters untyped,
     or use Any.
 
-    Why do we need type_hints separate with
-    Signature. The reason is simple.
-    If some variable doesn't have a type hint
-    it won't be added in the dict of type hints.
-
-    :param signature: original function's signature.
-    :param type_hints: function's type hints.
+    :param param_specs: precomputed (name, validator) pairs.
     :param message: incoming message.
     """
-    if signature is None:
+    if not param_specs:
         return
-    argnum = -1
-    # Iterate over function's params.
-    for param_name in signature.parameters:
-        # If parameter doesn't have an annotation.
-        annot = type_hints.get(param_name)
-        if annot is None:
+    args = message.args
+    kwargs = message.kwargs
+    nargs = len(args)
+    # The per-param debug call is skipped entirely,
+    # unless debug logging is actually on.
+    debug_enabled = logger.isEnabledFor(DEBUG)
+    # The first params are mapped to positional arguments.
+    for argnum, (param_name, validator) in enumerate(param_specs[:nargs]):
+        value = args[argnum]
+        if value is None:
+            continue
+        if debug_enabled:
+            logger.debug("Trying to parse %s", param_name)
+        try:
+            # trying to parse found value as in type annotation.
+            args[argnum] = validator(value)
+        except (ValueError, RuntimeError) as exc:
+            logger.debug(exc, exc_info=True)
+    # The rest of the params come from kwargs.
+    for param_name, validator in param_specs[nargs:]:
+        value = kwargs.get(param_name)
+        if value is None:
             continue
-        # Increment argument numbers. This is
-        # for positional arguments.
-        argnum += 1
-        # Value from incoming message.
-        value = None
-        logger.debug("Trying to parse %s as %s", param_name, annot)
-        # Check if we have positional arguments in passed message.
-        if argnum < len(message.args):
-            # Get positional argument.
-            value = message.args[argnum]
-            if value is None:
-                continue
-            try:
-                # trying to parse found value as in type annotation.
-                message.args[argnum] = parse_obj_as(annot, value)
-            except (ValueError, RuntimeError) as exc:
-                logger.debug(exc, exc_info=True)
-        else:
-            # We try to get this parameter from kwargs.
-            value = message.kwargs.get(param_name)
-            if value is None:
-                continue
-            try:
-                # trying to parse found value as in type annotation.
-                message.kwargs[param_name] = parse_obj_as(annot, value)
-            except (ValueError, RuntimeError) as exc:
-                logger.debug(exc, exc_info=True)
+        if debug_enabled:
+            logger.debug("Trying to parse %s", param_name)
+        try:
+            # trying to parse found value as in type annotation.
+            kwargs[param_name] = validator(value)
+        except (ValueError, RuntimeError) as exc:
+            logger.debug(exc, exc_info=True)
@@ -1,9 +1,21 @@
 import asyncio
 import inspect
 from concurrent.futures import Executor
+from functools import partial
 from logging import getLogger
-from time import time
-from typing import Any, Callable, Dict, List, Optional, Set, Union, get_type_hints
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    get_type_hints,
+)
 
 import anyio
 from taskiq_dependencies import DependencyGraph
@@ -14,7 +26,7 @@ from taskiq.acks import AcknowledgeType
 from taskiq.context import Context
 from taskiq.exceptions import NoResultError
 from taskiq.message import TaskiqMessage
-from taskiq.receiver.params_parser import parse_params
+from taskiq.receiver.params_parser import ParamSpecs, build_param_specs, parse_params
 from taskiq.result import TaskiqResult
 from taskiq.state import TaskiqState
 from taskiq.utils import maybe_awaitable
@@ -23,23 +35,12 @@ logger = getLogger(__name__)
 QUEUE_DONE = b"-1"
 
 
-def _run_sync(
-    target: Callable[..., Any],
-    args: List[Any],
-    kwargs: Dict[str, Any],
-) -> Any:
-    """
-    Runs function synchronously.
+class _PreparedTask(NamedTuple):
+    """Precomputed per-task data used on the hot path."""
 
-    We use this function, because
-    we cannot pass kwargs in loop.run_with_executor().
-
-    :param target: function to execute.
-    :param args: list of function's args.
-    :param kwargs: dict of function's kwargs.
-    :return: result of function's execution.
-    """
-    return target(*args, **kwargs)
+    param_specs: Optional[ParamSpecs]
+    dependency_graph: DependencyGraph
+    is_async: bool
 
 
 class Receiver:
@@ -58,6 +59,7 @@ class Receiver:
         on_exit: Optional[Callable[["Receiver"], None]] = None,
         max_tasks_to_execute: Optional[int] = None,
         wait_tasks_timeout: Optional[float] = None,
+        result_batch_size: int = 0,
     ) -> None:
         self.broker = broker
         self.executor = executor
@@ -65,6 +67,7 @@ class Receiver:
         self.validate_params = validate_params
         self.task_signatures: Dict[str, inspect.Signature] = {}
         self.task_hints: Dict[str, Dict[str, Any]] = {}
+        self.task_dispatch: Dict[str, _PreparedTask] = {}
         self.dependency_graphs: Dict[str, DependencyGraph] = {}
         self.propagate_exceptions = propagate_exceptions
         self.on_exit = on_exit
@@ -72,6 +75,16 @@ class Receiver:
         self.known_tasks: Set[str] = set()
         self.max_tasks_to_execute = max_tasks_to_execute
         self.wait_tasks_timeout = wait_tasks_timeout
+        self.result_batch_size = result_batch_size
+        # Queue for batched result saving. If it's None,
+        # results are saved one by one.
+        self._results_queue: Optional[
+            "asyncio.Queue[Tuple[str, TaskiqResult[Any], asyncio.Future[None]]]"
+        ] = None
+        if result_batch_size > 0:
+            self._results_queue = asyncio.Queue()
+        self._middlewares_snapshot: Tuple[TaskiqMiddleware, ...] = ()
+        self._build_middleware_chains()
         for task in self.broker.get_all_tasks().values():
             self._prepare_task(task.task_name, task.original_func)
         self.sem: "Optional[asyncio.Semaphore]" = None
@@ -113,7 +126,7 @@ class Receiver:
                 exc_info=True,
             )
             return
-        logger.debug(f"Received message: {taskiq_msg}")
+        logger.debug("Received message: %s", taskiq_msg)
         task = self.broker.find_task(taskiq_msg.task_name)
         if task is None:
             logger.warning(
@@ -125,13 +138,14 @@ class Receiver:
             "Function for task %s is resolved. Executing...",
             taskiq_msg.task_name,
         )
-        for middleware in self.broker.middlewares:
-            if middleware.__class__.pre_execute != TaskiqMiddleware.pre_execute:
-                taskiq_msg = await maybe_awaitable(
-                    middleware.pre_execute(
-                        taskiq_msg,
-                    ),
-                )
+        self._refresh_middleware_chains()
+        for pre_execute, is_async in self._pre_execute_chain:
+            modified_msg = pre_execute(taskiq_msg)
+            # Sync hooks may still return coroutines,
+            # so we fall back to an awaitable check.
+            if is_async or inspect.isawaitable(modified_msg):
+                modified_msg = await modified_msg
+            taskiq_msg = modified_msg
 
         logger.info(
             "Executing task %s with ID: %s",
@@ -156,17 +170,19 @@ class Receiver:
         ):
             await maybe_awaitable(message.ack())
 
-        for middleware in self.broker.middlewares:
-            if middleware.__class__.post_execute != TaskiqMiddleware.post_execute:
-                await maybe_awaitable(middleware.post_execute(taskiq_msg, result))
+        for post_execute, is_async in self._post_execute_chain:
+            hook_result = post_execute(taskiq_msg, result)
+            if is_async or inspect.isawaitable(hook_result):
+                await hook_result
 
         try:
             if not isinstance(result.error, NoResultError):
-                await self.broker.result_backend.set_result(taskiq_msg.task_id, result)
+                await self._save_result(taskiq_msg.task_id, result)
 
-                for middleware in self.broker.middlewares:
-                    if middleware.__class__.post_save != TaskiqMiddleware.post_save:
-                        await maybe_awaitable(middleware.post_save(taskiq_msg, result))
+                for post_save, is_async in self._post_save_chain:
+                    hook_result = post_save(taskiq_msg, result)
+                    if is_async or inspect.isawaitable(hook_result):
+                        await hook_result
 
         except Exception as exc:
             logger.exception(
@@ -209,13 +225,17 @@ class Receiver:
         loop = asyncio.get_running_loop()
         returned = None
         found_exception: "Optional[BaseException]" = None
-        signature = None
-        if message.task_name not in self.known_tasks:
-            self._prepare_task(message.task_name, target)
-        if self.validate_params:
-            signature = self.task_signatures.get(message.task_name)
-        dependency_graph = self.dependency_graphs.get(message.task_name)
-        parse_params(signature, self.task_hints.get(message.task_name) or {}, message)
+        # All per-task data is flattened into a single
+        # dispatch entry, so the hot path does one dict
+        # lookup instead of several.
+        prepared = self.task_dispatch.get(message.task_name)
+        if prepared is None:
+            prepared = self._prepare_task(message.task_name, target)
+        dependency_graph = prepared.dependency_graph
+        # Parsing params makes sense only if the message
+        # actually carries any and validation is enabled.
+        if (message.args or message.kwargs) and prepared.param_specs:
+            parse_params(prepared.param_specs, message)
 
         dep_ctx = None
         # Kwargs are defined in another variable,
@@ -238,7 +258,7 @@ class Receiver:
             # Resolve all function's dependencies.
 
         # Start a timer.
-        start_time = time()
+        start_time = perf_counter()
 
         try:
             # We put kwargs resolving here,
@@ -248,20 +268,26 @@ class Receiver:
                 kwargs = await dep_ctx.resolve_kwargs()
             # We udpate kwargs with kwargs from network.
             kwargs.update(message.kwargs)
-            is_coroutine = True
+            # Asyncness is detected when the task is prepared,
+            # so we don't walk the wrapper chain per message.
+            is_coroutine = prepared.is_async
             # If the function is a coroutine, we await it.
-            if asyncio.iscoroutinefunction(target):
+            if is_coroutine:
                 target_future = target(*message.args, **kwargs)
+            # If this is a synchronous function, we
+            # run it in executor. Kwargs are wrapped
+            # in a partial, since run_in_executor
+            # cannot pass them to the target.
+            elif kwargs:
+                target_future = loop.run_in_executor(
+                    self.executor,
+                    partial(target, *message.args, **kwargs),
+                )
             else:
-                is_coroutine = False
-                # If this is a synchronous function, we
-                # run it in executor.
                 target_future = loop.run_in_executor(
                     self.executor,
-                    _run_sync,
                     target,
-                    message.args,
-                    kwargs,
+                    *message.args,
                 )
             timeout = message.labels.get("timeout")
             if timeout is not None:
@@ -284,7 +310,7 @@ class Receiver:
                 exc_info=True,
             )
         # Stop the timer.
-        execution_time = time() - start_time
+        execution_time = perf_counter() - start_time
         if dep_ctx:
             args = (None, None, None)
             if found_exception and self.propagate_exceptions:
@@ -306,15 +332,15 @@ class Receiver:
         )
         # If exception is found we execute middlewares.
         if found_exception is not None:
-            for middleware in self.broker.middlewares:
-                if middleware.__class__.on_error != TaskiqMiddleware.on_error:
-                    await maybe_awaitable(
-                        middleware.on_error(
-                            message,
-                            result,
-                            found_exception,
-                        ),
-                    )
+            self._refresh_middleware_chains()
+            for on_error, is_async in self._on_error_chain:
+                hook_result = on_error(
+                    message,
+                    result,
+                    found_exception,
+                )
+                if is_async or inspect.isawaitable(hook_result):
+                    await hook_result
 
         return result
 
@@ -325,6 +351,14 @@ class Receiver:
         It uses listen() method of an AsyncBroker
         to get new messages from queues.
 
+        Consumption and execution are decoupled: the
+        prefetcher feeds an internal queue, while the runner
+        drains it and executes every message in its own
+        asyncio task. Back-pressure comes from the prefetch
+        and max_async_tasks semaphores, so one slow task
+        never stalls consumption. As a trade-off, completion
+        order is not guaranteed to match arrival order.
+
         Also it has a finish_event, that indicates that
         we need to stop listening for new tasks and shutdown.
         """
@@ -333,9 +367,19 @@ class Receiver:
         logger.info("Listening started.")
         queue: "asyncio.Queue[Union[bytes, AckableMessage]]" = asyncio.Queue()
 
-        async with anyio.create_task_group() as gr:
-            gr.start_soon(self.prefetcher, queue, finish_event)
-            gr.start_soon(self.runner, queue)
+        saver_task: "Optional[asyncio.Task[Any]]" = None
+        if self._results_queue is not None:
+            saver_task = asyncio.create_task(self._result_saver())
+
+        try:
+            async with anyio.create_task_group() as gr:
+                gr.start_soon(self.prefetcher, queue, finish_event)
+                gr.start_soon(self.runner, queue)
+        finally:
+            # The saver must be stopped even if listening
+            # itself was cancelled, otherwise it leaks.
+            if saver_task is not None:
+                saver_task.cancel()
 
         if self.on_exit is not None:
             self.on_exit(self)
@@ -356,16 +400,22 @@ class Receiver:
         current_message: asyncio.Task[bytes | AckableMessage] = asyncio.create_task(
             iterator.__anext__(),  # type: ignore
         )
+        # Loop-invariant names are bound to locals,
+        # so the loop doesn't resolve them on every iteration.
+        is_finished = finish_event.is_set
+        sem_acquire = self.sem_prefetch.acquire
+        sem_release = self.sem_prefetch.release
+        max_tasks_to_execute = self.max_tasks_to_execute
+        queue_put = queue.put
+        create_task = asyncio.create_task
+        anext_message = iterator.__anext__
 
         while True:
-            if finish_event.is_set():
+            if is_finished():
                 break
             try:
-                await self.sem_prefetch.acquire()
-                if (
-                    self.max_tasks_to_execute
-                    and fetched_tasks >= self.max_tasks_to_execute
-                ):
+                await sem_acquire()
+                if max_tasks_to_execute and fetched_tasks >= max_tasks_to_execute:
                     logger.info("Max number of tasks executed.")
                     break
                 # Here we wait for the message to be fetched,
@@ -374,14 +424,14 @@ class Receiver:
                 # If the message is not fetched, we release the semaphore
                 # and continue the loop. So it will check if finished event was set.
                 if not done:
-                    self.sem_prefetch.release()
+                    sem_release()
                     continue
                 # We're done, so now we need to check
                 # wether task has returned an error.
                 message = current_message.result()
-                current_message = asyncio.create_task(iterator.__anext__())  # type: ignore
+                current_message = create_task(anext_message())  # type: ignore
                 fetched_tasks += 1
-                await queue.put(message)
+                await queue_put(message)
             except (asyncio.CancelledError, StopAsyncIteration):
                 break
         # We don't want to fetch new messages if we are shutting down.
@@ -397,6 +447,9 @@ class Receiver:
         """
         Run tasks.
 
+        Every message is executed in a separate asyncio
+        task, bounded by the max_async_tasks semaphore.
+
         :param queue: queue with prefetched data.
         """
         tasks: Set[asyncio.Task[Any]] = set()
@@ -415,26 +468,35 @@ class Receiver:
             if self.sem is not None:
                 self.sem.release()
 
+        # Loop-invariant names are bound to locals,
+        # so the loop doesn't resolve them on every iteration.
+        sem = self.sem
+        sem_prefetch_release = self.sem_prefetch.release
+        queue_get = queue.get
+        create_task = asyncio.create_task
+        callback = self.callback
+
         while True:
             try:
                 # Waits for semaphore to be released.
-                if self.sem is not None:
-                    await self.sem.acquire()
+                if sem is not None:
+                    await sem.acquire()
 
-                self.sem_prefetch.release()
-                message = await queue.get()
+                sem_prefetch_release()
+                message = await queue_get()
                 if message is QUEUE_DONE:
                     # asyncio.wait will throw an error if there is nothing to wait for
                     if tasks:
                         logger.info(
-                            f"Waiting for {len(tasks)} running tasks to complete...",
+                            "Waiting for %d running tasks to complete...",
+                            len(tasks),
                         )
                         await asyncio.wait(tasks, timeout=self.wait_tasks_timeout)
                         logger.info("No more tasks to wait for. Shutting down.")
                     break
 
-                task = asyncio.create_task(
-                    self.callback(message=message, raise_err=False),
+                task = create_task(
+                    callback(message=message, raise_err=False),
                 )
                 tasks.add(task)
 
@@ -450,7 +512,113 @@ class Receiver:
                 break
         logger.info("The runner is stopped.")
 
-    def _prepare_task(self, name: str, handler: Callable[..., Any]) -> None:
+    def _build_middleware_chains(self) -> None:
+        """
+        Precompute middleware call chains.
+
+        Iterating all middlewares and comparing their
+        methods with the base class's ones for every
+        message is wasteful. Instead we snapshot bound
+        methods of middlewares that actually override
+        each hook and call only those.
+
+        Middlewares can be added to the broker after
+        the receiver is created, so callers re-run this
+        method whenever the middleware list changes.
+        """
+        middlewares = self.broker.middlewares
+        self._middlewares_snapshot = tuple(middlewares)
+
+        def hook_chain(hook_name: str) -> List[Tuple[Callable[..., Any], bool]]:
+            base_hook = getattr(TaskiqMiddleware, hook_name)
+            chain = []
+            for middleware in middlewares:
+                if getattr(middleware.__class__, hook_name) != base_hook:
+                    hook = getattr(middleware, hook_name)
+                    # Asyncness of every hook is computed here.
+                    # Dispatching only checks the returned value
+                    # for awaitability when this flag is False,
+                    # since sync hooks may return coroutines.
+                    chain.append((hook, asyncio.iscoroutinefunction(hook)))
+            return chain
+
+        self._pre_execute_chain = hook_chain("pre_execute")
+        self._post_execute_chain = hook_chain("post_execute")
+        self._post_save_chain = hook_chain("post_save")
+        self._on_error_chain = hook_chain("on_error")
+
+    def _refresh_middleware_chains(self) -> None:
+        """
+        Rebuild middleware chains if the middleware list changed.
+
+        We compare identities of the middlewares with the
+        snapshot taken on the last rebuild, so replacing a
+        middleware is detected even when the list keeps
+        the same length.
+        """
+        if tuple(self.broker.middlewares) != self._middlewares_snapshot:
+            self._build_middleware_chains()
+
+    async def _save_result(
+        self,
+        task_id: str,
+        result: "TaskiqResult[Any]",
+    ) -> None:
+        """
+        Save result in the result backend.
+
+        If result batching is enabled, the result is
+        enqueued for the saver and this method waits
+        until the whole batch is written. This keeps
+        acknowledgements and post_save middlewares
+        ordered exactly as with direct saving.
+
+        :param task_id: id of a task.
+        :param result: result of execution.
+        """
+        if self._results_queue is None:
+            await self.broker.result_backend.set_result(task_id, result)
+            return
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        await self._results_queue.put((task_id, result, waiter))
+        await waiter
+
+    async def _result_saver(self) -> None:
+        """
+        Save results in batches.
+
+        This coroutine drains the results queue and writes
+        up to result_batch_size results with a single
+        set_results call, amortizing the result backend's
+        round-trip over the whole batch.
+        """
+        queue = self._results_queue
+        if queue is None:  # pragma: no cover
+            return
+        result_backend = self.broker.result_backend
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.result_batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            saving_error: Optional[BaseException] = None
+            try:
+                await result_backend.set_results(
+                    (task_id, result) for task_id, result, _ in batch
+                )
+            except Exception as exc:
+                saving_error = exc
+            for _, _, waiter in batch:
+                if waiter.done():
+                    continue
+                if saving_error is None:
+                    waiter.set_result(None)
+                else:
+                    waiter.set_exception(saving_error)
+
+    def _prepare_task(self, name: str, handler: Callable[..., Any]) -> _PreparedTask:
         """
         Prepare task for execution.
 
@@ -464,8 +632,29 @@ class Receiver:
 
         :param name: task name.
         :param handler: task handler.
+        :return: precomputed dispatch entry.
         """
         self.known_tasks.add(name)
-        self.task_signatures[name] = inspect.signature(handler)
-        self.task_hints[name] = get_type_hints(handler)
-        self.dependency_graphs[name] = DependencyGraph(handler)
+        # Decorated tasks carry their signature computed
+        # at decoration time.
+        signature = getattr(
+            handler,
+            "__taskiq_signature__",
+            None,
+        ) or inspect.signature(handler)
+        hints = get_type_hints(handler)
+        self.task_signatures[name] = signature
+        self.task_hints[name] = hints
+        dependency_graph = DependencyGraph(handler)
+        self.dependency_graphs[name] = dependency_graph
+        prepared = _PreparedTask(
+            # With disabled validation we store no specs,
+            # so the hot path doesn't even check the flag.
+            param_specs=(
+                build_param_specs(signature, hints) if self.validate_params else None
+            ),
+            dependency_graph=dependency_graph,
+            is_async=asyncio.iscoroutinefunction(handler),
+        )
+        self.task_dispatch[name] = prepared
+        return prepared
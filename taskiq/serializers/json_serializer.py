@@ -5,7 +5,13 @@ from taskiq.abc.serializer import TaskiqSerializer
 
 
 class JSONSerializer(TaskiqSerializer):
-    """Default taskiq serializer."""
+    """
+    Default taskiq serializer.
+
+    It uses the stdlib json module. For high message
+    rates consider the drop-in ORJSONSerializer or
+    MSGPackSerializer, which decode several times faster.
+    """
 
     def __init__(self, default: Optional[Callable[..., None]] = None) -> None:
         self.default = default
@@ -29,4 +35,6 @@ class JSONSerializer(TaskiqSerializer):
         :param value: value to parse.
         :return: decoded value.
         """
-        return loads(value.decode())
+        # json.loads accepts bytes directly,
+        # decoding upfront would just copy the payload.
+        return loads(value)
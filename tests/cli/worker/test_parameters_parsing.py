@@ -7,7 +7,7 @@ from pydantic import BaseModel
 
 from taskiq.compat import model_copy
 from taskiq.message import TaskiqMessage
-from taskiq.receiver.params_parser import parse_params
+from taskiq.receiver.params_parser import build_param_specs, parse_params
 
 
 class _TestPydanticClass(BaseModel):
@@ -30,8 +30,7 @@ def test_parse_params_no_signature() -> None:
     )
     modify_msg = model_copy(src_msg, deep=True)
     parse_params(
-        signature=None,
-        type_hints={},
+        build_param_specs(signature=None, type_hints={}),
         message=modify_msg,
     )
 
@@ -54,8 +53,7 @@ def test_parse_params_classes(test_class: Type[Any]) -> None:
     )
 
     parse_params(
-        inspect.signature(test_func),
-        get_type_hints(test_func),
+        build_param_specs(inspect.signature(test_func), get_type_hints(test_func)),
         msg_with_args,
     )
 
@@ -71,8 +69,7 @@ def test_parse_params_classes(test_class: Type[Any]) -> None:
     )
 
     parse_params(
-        inspect.signature(test_func),
-        get_type_hints(test_func),
+        build_param_specs(inspect.signature(test_func), get_type_hints(test_func)),
         msg_with_kwargs,
     )
 
@@ -96,8 +93,7 @@ def test_parse_params_wrong_data(test_class: Type[Any]) -> None:
     )
 
     parse_params(
-        inspect.signature(test_func),
-        get_type_hints(test_func),
+        build_param_specs(inspect.signature(test_func), get_type_hints(test_func)),
         msg_with_args,
     )
 
@@ -112,8 +108,7 @@ def test_parse_params_wrong_data(test_class: Type[Any]) -> None:
     )
 
     parse_params(
-        inspect.signature(test_func),
-        get_type_hints(test_func),
+        build_param_specs(inspect.signature(test_func), get_type_hints(test_func)),
         msg_with_kwargs,
     )
 
@@ -135,7 +130,10 @@ def test_parse_params_nones(test_class: Type[Any]) -> None:
         kwargs={},
     )
 
-    parse_params(inspect.signature(test_func), get_type_hints(test_func), msg_with_args)
+    parse_params(
+        build_param_specs(inspect.signature(test_func), get_type_hints(test_func)),
+        msg_with_args,
+    )
 
     assert msg_with_args.args[0] is None
 
@@ -148,8 +146,7 @@ def test_parse_params_nones(test_class: Type[Any]) -> None:
     )
 
     parse_params(
-        inspect.signature(test_func),
-        get_type_hints(test_func),
+        build_param_specs(inspect.signature(test_func), get_type_hints(test_func)),
         msg_with_kwargs,
     )
 
@@ -2,14 +2,14 @@ import asyncio
 import random
 import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, ClassVar, List, Optional
+from typing import Any, ClassVar, Coroutine, List, Optional
 
 import pytest
 from taskiq_dependencies import Depends
 
 from taskiq.abc.broker import AckableMessage, AsyncBroker
 from taskiq.abc.middleware import TaskiqMiddleware
-from taskiq.brokers.inmemory_broker import InMemoryBroker
+from taskiq.brokers.inmemory_broker import InMemoryBroker, InmemoryResultBackend
 from taskiq.exceptions import NoResultError, TaskiqResultTimeoutError
 from taskiq.message import TaskiqMessage
 from taskiq.receiver import Receiver
@@ -189,6 +189,45 @@ async def test_run_task_exception_middlewares() -> None:
     assert _TestMiddleware.found_exceptions[0].__class__ is ValueError
 
 
+@pytest.mark.anyio
+async def test_sync_middleware_returns_coroutine() -> None:
+    """Tests that coroutines returned by sync hooks are awaited."""
+
+    class _TestMiddleware(TaskiqMiddleware):
+        found_exceptions: ClassVar[List[BaseException]] = []
+
+        def on_error(
+            self,
+            message: "TaskiqMessage",
+            result: "TaskiqResult[Any]",
+            exception: BaseException,
+        ) -> Coroutine[Any, Any, None]:
+            async def save_exception() -> None:
+                self.found_exceptions.append(exception)
+
+            return save_exception()
+
+    def test_func() -> None:
+        raise ValueError
+
+    broker = InMemoryBroker().with_middlewares(_TestMiddleware())
+    receiver = get_receiver(broker)
+
+    result = await receiver.run_task(
+        test_func,
+        TaskiqMessage(
+            task_id="",
+            task_name="",
+            labels={},
+            args=[],
+            kwargs={},
+        ),
+    )
+    assert result.is_err
+    assert len(_TestMiddleware.found_exceptions) == 1
+    assert _TestMiddleware.found_exceptions[0].__class__ is ValueError
+
+
 @pytest.mark.anyio
 async def test_callback_success() -> None:
     """Test that callback function works well."""
@@ -237,6 +276,7 @@ async def test_callback_no_dep_info() -> None:
     receiver.dependency_graphs.pop(my_task.task_name, None)
     receiver.task_signatures.pop(my_task.task_name, None)
     receiver.task_hints.pop(my_task.task_name, None)
+    receiver.task_dispatch.pop(my_task.task_name, None)
 
     broker_message = broker.formatter.dumps(
         TaskiqMessage(
@@ -425,6 +465,32 @@ async def test_callback_semaphore() -> None:
     listen_task.cancel()
 
 
+@pytest.mark.anyio
+async def test_result_batching() -> None:
+    """Test that batched result saving stores all the results."""
+    broker = AsyncQueueBroker().with_result_backend(InmemoryResultBackend())
+
+    @broker.task
+    async def batched_task() -> int:
+        return 1
+
+    kicked = [await batched_task.kiq() for _ in range(5)]
+    receiver = Receiver(
+        broker,
+        executor=ThreadPoolExecutor(max_workers=10),
+        validate_params=True,
+        max_async_tasks=10,
+        result_batch_size=2,
+    )
+
+    listen_task = asyncio.create_task(receiver.listen(asyncio.Event()))
+    await broker.wait_tasks()
+    for task in kicked:
+        result = await task.wait_result(timeout=1)
+        assert result.return_value == 1
+    listen_task.cancel()
+
+
 @pytest.mark.anyio
 async def test_no_result_error() -> None:
     broker = InMemoryBroker()